@@ -27,6 +27,7 @@ from typing import (
     TYPE_CHECKING,
     TypeVar,
     Optional,
+    NamedTuple,
 )
 from enum import Enum, auto
 import copy
@@ -55,6 +56,7 @@ __all__ = [
     "Box",  # contains Item
     "Envelope",  # contains FlatItem
     "AbstractPacker",
+    "PackerSnapshot",
     "Packer",
     "FlatPacker",
     "RotationType",
@@ -399,6 +401,13 @@ PICK_STRATEGY = {
 }
 
 
+class PackerSnapshot(NamedTuple):
+    """Unpacked state of a packer, see :meth:`AbstractPacker.snapshot`."""
+
+    bins: tuple[Bin, ...]
+    items: tuple[tuple[Item, tuple[float, float, float], RotationType], ...]
+
+
 class AbstractPacker:
     def __init__(self) -> None:
         self.bins: list[Bin] = []
@@ -416,6 +425,34 @@ class AbstractPacker:
         packer.items = [item.copy() for item in self.items]
         return packer
 
+    def snapshot(self) -> PackerSnapshot:
+        """Returns the init state of the packer, which can be restored by
+        :meth:`restore` after packing.
+        """
+        if self.is_packed:
+            raise TypeError("cannot snapshot packed state")
+        if not all(box.is_empty for box in self.bins):
+            raise TypeError("bins contain data in unpacked state")
+        return PackerSnapshot(
+            tuple(self.bins),
+            tuple((item, item.position, item.rotation_type) for item in self.items),
+        )
+
+    def restore(self, snapshot: PackerSnapshot) -> None:
+        """Restores the init state of a :meth:`snapshot`. This allows multiple
+        packing runs by the same packer without the overhead of :meth:`copy`.
+        """
+        for box in snapshot.bins:
+            box.reset()
+        self.bins = list(snapshot.bins)
+        items: list[Item] = []
+        for item, position, rotation_type in snapshot.items:
+            item.position = position
+            item.rotation_type = rotation_type
+            items.append(item)
+        self.items = items
+        self._init_state = True
+
     @property
     def is_packed(self) -> bool:
         """Returns ``True`` if packer is packed, each packer can only be used
@@ -567,9 +604,14 @@ def get_item_subset(
 class SubSetEvaluator(ga.Evaluator):
     def __init__(self, packer: AbstractPacker):
         self.packer = packer
+        # a single packer is reused for all evaluations
+        self._scratch_packer = packer.copy()
+        self._snapshot = self._scratch_packer.snapshot()
 
     def evaluate(self, dna: ga.DNA) -> float:
-        packer = self.run_packer(dna)
+        packer = self._scratch_packer
+        packer.restore(self._snapshot)
+        pack_item_subset(packer, dna)
         return packer.get_fill_ratio()
 
     def run_packer(self, dna: ga.DNA) -> AbstractPacker:
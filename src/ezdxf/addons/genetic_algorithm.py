@@ -9,12 +9,13 @@ from typing import (
     Union,
 )
 import abc
-import copy
 from dataclasses import dataclass
 import json
 import random
 import time
 
+import numpy as np
+
 # example usage:
 # examples\addons\optimize\bin_packing_forms.py
 # examples\addons\optimize\tsp.py
@@ -23,8 +24,9 @@ import time
 class DNA(abc.ABC):
     """Abstract DNA class."""
 
-    fitness: Optional[float] = None
-    _data: list
+    __slots__ = ("_data", "fitness")
+    fitness: Optional[float]
+    _data: Union[list, np.ndarray]
 
     @abc.abstractmethod
     def reset(self, values: Iterable):
@@ -36,7 +38,14 @@ class DNA(abc.ABC):
         ...
 
     def copy(self):
-        return copy.deepcopy(self)
+        """Returns a copy including the fitness value. The DNA data is a flat
+        list or ndarray, subclasses with additional attributes have to extend
+        this method.
+        """
+        dna = object.__new__(self.__class__)
+        dna._data = self._data.copy()
+        dna.fitness = self.fitness
+        return dna
 
     def _taint(self):
         self.fitness = None
@@ -65,6 +74,29 @@ class DNA(abc.ABC):
     def flip_mutate_at(self, index: int) -> None:
         ...
 
+    def flip_mutate(self, rate: float) -> None:
+        """Flip mutate each location with a probability of `rate`."""
+        mutated = False
+        for index in range(len(self)):
+            if random.random() < rate:
+                self.flip_mutate_at(index)
+                mutated = True
+        if mutated:
+            self._taint()
+
+    def uniform_crossover(self, other: DNA) -> None:
+        """Swap each location with `other` with a probability of 50%."""
+        for index in range(len(self)):
+            if random.random() > 0.5:
+                self[index], other[index] = other[index], self[index]
+
+    def two_point_crossover(self, other: DNA, i1: int, i2: int) -> None:
+        """Swap the locations from index `i1` to `i2` with `other`."""
+        part1 = self[i1:i2]
+        part2 = other[i1:i2]
+        self[i1:i2] = part2
+        other[i1:i2] = part1
+
 
 def dna_fitness(dna: DNA) -> float:
     return dna.fitness  # type: ignore
@@ -82,9 +114,7 @@ class FlipMutate(Mutate):
     """Flip one bit mutation."""
 
     def mutate(self, dna: DNA, rate: float):
-        for index in range(len(dna)):
-            if random.random() < rate:
-                dna.flip_mutate_at(index)
+        dna.flip_mutate(rate)
 
 
 class NeighborSwapMutate(Mutate):
@@ -94,9 +124,7 @@ class NeighborSwapMutate(Mutate):
         for index in range(len(dna)):
             if random.random() < rate:
                 i2 = index - 1
-                tmp = dna[i2]
-                dna[i2] = dna[index]
-                dna[index] = tmp
+                dna[i2], dna[index] = dna[index], dna[i2]
 
 
 class RandomSwapMutate(Mutate):
@@ -109,9 +137,7 @@ class RandomSwapMutate(Mutate):
                 i2 = random.randrange(0, length)
                 if i2 == index:
                     i2 -= 1
-                tmp = dna[i2]
-                dna[i2] = dna[index]
-                dna[index] = tmp
+                dna[i2], dna[index] = dna[index], dna[i2]
 
 
 class ReverseMutate(Mutate):
@@ -182,11 +208,7 @@ class MateUniformCX(Mate):
     """Uniform recombination."""
 
     def recombine(self, dna1: DNA, dna2: DNA):
-        for index in range(len(dna1)):
-            if random.random() > 0.5:
-                tmp = dna1[index]
-                dna1[index] = dna2[index]
-                dna2[index] = tmp
+        dna1.uniform_crossover(dna2)
 
 
 class MateOrderedCX(Mate):
@@ -203,10 +225,7 @@ class MateOrderedCX(Mate):
 
 def recombine_dna_2pcx(dna1: DNA, dna2: DNA, i1: int, i2: int) -> None:
     """Two point crossover."""
-    part1 = dna1[i1:i2]
-    part2 = dna2[i1:i2]
-    dna1[i1:i2] = part2
-    dna2[i1:i2] = part1
+    dna1.two_point_crossover(dna2, i1, i2)
 
 
 def recombine_dna_ocx1(dna1: DNA, dna2: DNA, i1: int, i2: int) -> None:
@@ -237,79 +256,311 @@ def replace_dna_ocx1(dna1: DNA, dna2: DNA, i1: int, i2: int) -> None:
 class FloatDNA(DNA):
     """Arbitrary float numbers in the range [0, 1]."""
 
-    __slots__ = ("_data", "fitness")
+    __slots__ = ()
 
     def __init__(self, values: Iterable[float]):
-        self._data: list[float] = list(values)
+        self._data: np.ndarray = _float_array(values)
         self._check_valid_data()
         self.fitness: Optional[float] = None
 
     @classmethod
     def random(cls, length: int) -> FloatDNA:
-        return cls((random.random() for _ in range(length)))
+        return cls._from_array(_random_floats(length))
 
     @classmethod
     def n_random(cls, n: int, length: int) -> list[FloatDNA]:
-        return [cls.random(length) for _ in range(n)]
+        # All values are created by one call of the random generator, each DNA
+        # gets a copy of its row, so a single surviving DNA does not keep the
+        # whole array alive.
+        values = _random_floats(n * length).reshape(n, length)
+        return [cls._from_array(row.copy()) for row in values]
+
+    @classmethod
+    def _from_array(cls, data: np.ndarray) -> FloatDNA:
+        """Returns a new DNA which uses `data` without a copy or validation."""
+        dna = object.__new__(cls)
+        dna._data = data
+        dna.fitness = None
+        return dna
 
     @property
     def is_valid(self) -> bool:
-        return all(0.0 <= v <= 1.0 for v in self._data)
+        data = self._data
+        # NaN values are invalid, this is not the case for a min/max check
+        return bool(np.logical_and(data >= 0.0, data <= 1.0).all())
 
     def _check_valid_data(self):
         if not self.is_valid:
             raise ValueError("data value out of range")
 
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self._data.tolist())})"
+
     def __str__(self):
         if self.fitness is None:
             fitness = ", fitness=None"
         else:
             fitness = f", fitness={self.fitness:.4f}"
-        return f"{str([round(v, 4) for v in self._data])}{fitness}"
+        return f"{str(self._data.round(4).tolist())}{fitness}"
+
+    def __eq__(self, other):
+        assert isinstance(other, self.__class__)
+        return np.array_equal(self._data, other._data)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            # slicing a ndarray returns a view, but DNA slices are independent
+            return self._data[item].copy()
+        return self._data[item]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice) and not isinstance(value, np.ndarray):
+            value = list(value)  # e.g. reversed() iterator
+        self._data[key] = value
+        self._taint()
+
+    def __iter__(self):
+        return iter(self._data.tolist())
 
     def reset(self, values: Iterable[float]):
-        self._data = list(values)
+        self._data = _float_array(values)
         self._check_valid_data()
         self._taint()
 
     def flip_mutate_at(self, index: int) -> None:
         self._data[index] = 1.0 - self._data[index]  # flip pick location
 
+    def flip_mutate(self, rate: float) -> None:
+        data = self._data
+        mask = _random_mask(len(data), rate)
+        if mask.any():
+            np.subtract(1.0, data, out=data, where=mask)
+            self._taint()
+
+    def uniform_crossover(self, other: DNA) -> None:
+        if not isinstance(other, FloatDNA):
+            super().uniform_crossover(other)
+            return
+        mask = _random_mask(len(self._data), 0.5)
+        if mask.any():
+            data1 = self._data
+            data2 = other._data
+            values = data1[mask]  # fancy indexing returns a copy
+            data1[mask] = data2[mask]
+            data2[mask] = values
+            self._taint()
+            other._taint()
+
+
+def _random_floats(count: int) -> np.ndarray:
+    """Returns `count` random floats in the range [0, 1).
+
+    The values are drawn from the :mod:`random` module, which is seeded by
+    :func:`random.seed` like all other random decisions of the optimizer.
+    """
+    # floats from 53 random bits, like random.random():
+    values = np.frombuffer(random.randbytes(count * 8), dtype=np.uint64)
+    return (values >> np.uint64(11)) * (1.0 / (1 << 53))
+
+
+def _random_mask(count: int, rate: float) -> np.ndarray:
+    """Returns a bool array, each item is True with a probability of `rate`."""
+    return _random_floats(count) < rate
+
+
+def _float_array(values: Iterable[float]) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64)  # always a copy
+    return np.fromiter(values, dtype=np.float64)
+
 
 class BitDNA(DNA):
-    """One bit DNA."""
+    """One bit DNA, the bits are stored in a compact uint64 bitmap."""
 
-    __slots__ = ("_data", "fitness")
+    __slots__ = ("_length",)
 
     def __init__(self, values: Iterable):
-        self._data: list[bool] = list(bool(v) for v in values)
+        self._set_bits(_bool_array(values))
         self.fitness: Optional[float] = None
 
+    def _set_bits(self, bits: np.ndarray) -> None:
+        self._length: int = len(bits)
+        self._data: np.ndarray = _pack_bits(bits)
+
+    def _bits(self) -> np.ndarray:
+        return _unpack_bits(self._data, self._length)
+
+    def _index(self, index: int) -> int:
+        length = self._length
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("DNA index out of range")
+        return index
+
     @property
     def is_valid(self) -> bool:
         return True  # everything can be evaluated to True/False
 
     @classmethod
     def random(cls, length: int) -> BitDNA:
-        return cls(bool(random.randint(0, 1)) for _ in range(length))
+        return cls._from_bitmap(_random_bitmap(length), length)
 
     @classmethod
     def n_random(cls, n: int, length: int) -> list[BitDNA]:
+        # Each DNA gets its own bitmap, a single surviving DNA does not keep
+        # the bitmaps of the whole population alive.
         return [cls.random(length) for _ in range(n)]
 
+    @classmethod
+    def _from_bitmap(cls, bitmap: np.ndarray, length: int) -> BitDNA:
+        """Returns a new DNA which uses `bitmap` without a copy."""
+        dna = object.__new__(cls)
+        dna._data = bitmap
+        dna._length = length
+        dna.fitness = None
+        return dna
+
+    def copy(self):
+        dna = super().copy()
+        dna._length = self._length
+        return dna
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self._bits().tolist())})"
+
     def __str__(self):
         if self.fitness is None:
             fitness = ", fitness=None"
         else:
             fitness = f", fitness={self.fitness:.4f}"
-        return f"{str([int(v) for v in self._data])}{fitness}"
+        return f"{str(self._bits().astype(np.uint8).tolist())}{fitness}"
+
+    def __eq__(self, other):
+        assert isinstance(other, self.__class__)
+        # the unused bits of the last bitmap word are always 0
+        return self._length == other._length and np.array_equal(
+            self._data, other._data
+        )
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._bits()[item].tolist()
+        index = item + self._length if item < 0 else item
+        if not 0 <= index < self._length:
+            raise IndexError("DNA index out of range")
+        # ndarray.item() returns a Python int, np.uint64 arithmetic is slow
+        return (self._data.item(index >> 6) >> (index & 63)) & 1 == 1
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            bits = self._bits()
+            bits[key] = list(value)
+            self._set_bits(bits)
+        else:
+            index = self._index(key)
+            data = self._data
+            word = index >> 6
+            mask = 1 << (index & 63)
+            if value:
+                data[word] = data.item(word) | mask
+            else:
+                data[word] = data.item(word) & ~mask
+        self._taint()
+
+    def __iter__(self):
+        return iter(self._bits().tolist())
 
     def reset(self, values: Iterable) -> None:
-        self._data = list(bool(v) for v in values)
+        self._set_bits(_bool_array(values))
         self._taint()
 
     def flip_mutate_at(self, index: int) -> None:
-        self._data[index] = not self._data[index]
+        index = self._index(index)
+        word = index >> 6
+        self._data[word] = self._data.item(word) ^ (1 << (index & 63))
+
+    def flip_mutate(self, rate: float) -> None:
+        mask = _random_mask(self._length, rate)
+        if mask.any():
+            self._data ^= _pack_bits(mask)  # 64 flips at once
+            self._taint()
+
+    def uniform_crossover(self, other: DNA) -> None:
+        if not isinstance(other, BitDNA) or other._length != self._length:
+            super().uniform_crossover(other)
+            return
+        self._swap_bits(other, _random_bitmap(self._length))
+
+    def two_point_crossover(self, other: DNA, i1: int, i2: int) -> None:
+        if not isinstance(other, BitDNA) or other._length != self._length:
+            super().two_point_crossover(other, i1, i2)
+            return
+        # same index range as slicing a list:
+        start, stop, _ = slice(i1, i2).indices(self._length)
+        if start < stop:
+            self._swap_bits(other, _range_bitmap(self._length, start, stop))
+
+    def _swap_bits(self, other: BitDNA, mask: np.ndarray) -> None:
+        # swap the masked bits with `other` by XOR, 64 bits at once:
+        data1 = self._data
+        data2 = other._data
+        diff = (data1 ^ data2) & mask
+        if diff.any():
+            data1 ^= diff
+            data2 ^= diff
+            self._taint()
+            other._taint()
+
+
+BITMAP_TYPE = np.dtype("<u8")  # little-endian uint64, bit 0 is the first bit
+
+
+def _bool_array(values: Iterable) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values.astype(np.bool_)
+    return np.fromiter(map(bool, values), dtype=np.bool_)
+
+
+def _pack_bits(bits: np.ndarray) -> np.ndarray:
+    """Returns the bool array `bits` as uint64 bitmap, the unused bits of the last
+    word are 0. A 2D array is packed row by row.
+    """
+    count = bits.shape[-1]
+    padded = np.zeros(
+        bits.shape[:-1] + ((count + 63) // 64 * 64,), dtype=np.bool_
+    )
+    padded[..., :count] = bits
+    return np.packbits(padded, axis=-1, bitorder="little").view(BITMAP_TYPE)
+
+
+def _random_bitmap(count: int) -> np.ndarray:
+    """Returns a random uint64 bitmap of `count` bits drawn from the :mod:`random`
+    module, each bit is set with a probability of 50%.
+    """
+    size = (count + 63) // 64
+    bitmap = np.frombuffer(bytearray(random.randbytes(size * 8)), BITMAP_TYPE)
+    if count & 63:  # the unused bits of the last word have to be 0
+        bitmap[-1] &= np.uint64((1 << (count & 63)) - 1)
+    return bitmap
+
+
+def _range_bitmap(count: int, start: int, stop: int) -> np.ndarray:
+    """Returns a uint64 bitmap of `count` bits, where the bits from `start` to
+    `stop` are set.
+    """
+    size = (count + 63) // 64
+    bits = ((1 << (stop - start)) - 1) << start
+    return np.frombuffer(bits.to_bytes(size * 8, "little"), BITMAP_TYPE)
+
+
+def _unpack_bits(bitmap: np.ndarray, count: int) -> np.ndarray:
+    """Returns the first `count` bits of the uint64 bitmap as bool array."""
+    bits = np.unpackbits(bitmap.view(np.uint8), count=count, bitorder="little")
+    return bits.view(np.bool_)
 
 
 class UniqueIntDNA(DNA):
@@ -323,7 +574,7 @@ class UniqueIntDNA(DNA):
     ReversMutate() or ScrambleMutate()
     """
 
-    __slots__ = ("_data", "fitness")
+    __slots__ = ()
 
     def __init__(self, values: Union[int, Iterable]):
         self._data: list[int]
@@ -369,7 +620,7 @@ class IntegerDNA(DNA):
     E.g. IntegerDNA([0, 1, 2, 3, 4, 0, 1, 2, 3, 4], 5)
     """
 
-    __slots__ = ("_data", "fitness")
+    __slots__ = ("_max",)
 
     def __init__(self, values: Iterable[int], max_: int):
         self._max = int(max_)
@@ -391,6 +642,11 @@ class IntegerDNA(DNA):
     def is_valid(self) -> bool:
         return all(0 <= v < self._max for v in self._data)
 
+    def copy(self):
+        dna = super().copy()
+        dna._max = self._max
+        return dna
+
     def __repr__(self):
         return f"{self.__class__.__name__}({str(self._data)}, {self._max})"
 
@@ -634,16 +890,25 @@ class GeneticOptimizer:
         selector.reset(self.filter_threshold(self.candidates))
 
         if self.elitism > 0:
+            # The elites are added as they are, they carry their fitness value
+            # and are not evaluated again by measure_fitness(). The elites are
+            # never modified, mate() and mutate() work on copies.
             candidates.extend(self.hall_of_fame.get(self.elitism))
 
-        while len(candidates) < count:
-            dna1, dna2 = selector.pick(2)
+        # pick all parents at once, by pairs:
+        pairs = max(count - len(candidates) + 1, 0) // 2
+        parents = iter(selector.pick(pairs * 2))
+        # local names for the methods called for each offspring:
+        recombine = self.recombine
+        mutate = self.mutate
+        append = candidates.append
+        for dna1, dna2 in zip(parents, parents):
             dna1 = dna1.copy()
             dna2 = dna2.copy()
-            self.recombine(dna1, dna2)
-            self.mutate(dna1, dna2)
-            candidates.append(dna1)
-            candidates.append(dna2)
+            recombine(dna1, dna2)
+            mutate(dna1, dna2)
+            append(dna1)
+            append(dna2)
         self.candidates = candidates
 
     def filter_threshold(self, candidates: Sequence[DNA]) -> Iterable[DNA]:
@@ -663,9 +928,10 @@ class GeneticOptimizer:
         self.mutation.mutate(dna2, self.mutation_rate)
 
 
-def conv_negative_weights(weights: Iterable[float]) -> Iterable[float]:
-    # random.choices does not accept negative values: -100 -> 1/100, -10 -> 1/10
-    return (0.0 if w == 0.0 else 1.0 / abs(w) for w in weights)
+def conv_negative_weights(weights: Iterable[float]) -> np.ndarray:
+    # roulette selection does not accept negative weights: -100 -> 1/100, -10 -> 1/10
+    w = np.abs(_float_array(weights))
+    return np.divide(1.0, w, out=np.zeros_like(w), where=w != 0.0)
 
 
 class RouletteSelection(Selection):
@@ -673,21 +939,38 @@ class RouletteSelection(Selection):
 
     def __init__(self, negative_values: bool = False) -> None:
         self._candidates: list[DNA] = []
-        self._weights: list[float] = []
+        self._cum_weights: list[float] = []
         self._negative_values = bool(negative_values)
 
     def reset(self, candidates: Iterable[DNA]):
         # dna.fitness is not None here!
         self._candidates = list(candidates)
+        weights = np.fromiter(
+            (dna.fitness for dna in self._candidates),
+            dtype=np.float64,
+            count=len(self._candidates),
+        )
         if self._negative_values:
-            self._weights = list(
-                conv_negative_weights(dna.fitness for dna in self._candidates)  # type: ignore
-            )
-        else:
-            self._weights = [dna.fitness for dna in self._candidates]  # type: ignore
+            weights = conv_negative_weights(weights)
+        self._set_weights(weights)
+
+    def _set_weights(self, weights: np.ndarray) -> None:
+        if (weights < 0.0).any():
+            raise ValueError("negative weights not supported")
+        # The cumulative weights are calculated once for all picks, the weights
+        # do not require a normalization.
+        self._cum_weights = np.cumsum(weights).tolist()
 
     def pick(self, count: int) -> Iterable[DNA]:
-        return random.choices(self._candidates, self._weights, k=count)
+        if count < 1:
+            return []
+        cum_weights = self._cum_weights
+        if cum_weights[-1] > 0.0:
+            return random.choices(
+                self._candidates, cum_weights=cum_weights, k=count
+            )
+        # all weights are 0
+        return random.choices(self._candidates, k=count)
 
 
 class RankBasedSelection(RouletteSelection):
@@ -699,7 +982,9 @@ class RankBasedSelection(RouletteSelection):
         self._candidates.sort(key=dna_fitness)
         # weight of best_fitness == len(strands)
         # and decreases until 1 for the least fitness
-        self._weights = list(range(1, len(self._candidates) + 1))
+        self._set_weights(
+            np.arange(1, len(self._candidates) + 1, dtype=np.float64)
+        )
 
 
 class TournamentSelection(Selection):
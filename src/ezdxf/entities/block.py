@@ -139,27 +139,27 @@ class Block(DXFEntity):
     def export_entity(self, tagwriter: AbstractTagWriter) -> None:
         """Export entity specific data as DXF tags."""
         super().export_entity(tagwriter)
-
-        if tagwriter.dxfversion > DXF12:
-            tagwriter.write_tag2(SUBCLASS_MARKER, acdb_entity.name)
-        if self.dxf.hasattr("paperspace"):
-            tagwriter.write_tag2(67, 1)
-        self.dxf.export_dxf_attribs(tagwriter, "layer")
-        if tagwriter.dxfversion > DXF12:
-            tagwriter.write_tag2(SUBCLASS_MARKER, acdb_block_begin.name)
-
-        name = self.dxf.name
-        if tagwriter.dxfversion == DXF12:
+        dxf = self.dxf
+        write_tag2 = tagwriter.write_tag2
+        # check DXF version only once
+        r12 = tagwriter.dxfversion == DXF12
+        _export_acdb_entity(dxf, tagwriter, r12)
+
+        name = dxf.name
+        if r12:
             # export modelspace and paperspace with leading '$' instead of '*'
-            if name.lower() == MODEL_SPACE_R2000_LOWER:
+            name_lower = name.lower()
+            if name_lower == MODEL_SPACE_R2000_LOWER:
                 name = MODEL_SPACE_R12
-            elif name.lower() == PAPER_SPACE_R2000_LOWER:
+            elif name_lower == PAPER_SPACE_R2000_LOWER:
                 name = PAPER_SPACE_R12
+        else:
+            write_tag2(SUBCLASS_MARKER, acdb_block_begin.name)
 
-        tagwriter.write_tag2(2, name)
-        self.dxf.export_dxf_attribs(tagwriter, ["flags", "base_point"])
-        tagwriter.write_tag2(3, name)
-        self.dxf.export_dxf_attribs(tagwriter, ["xref_path", "description"])
+        write_tag2(2, name)
+        dxf.export_dxf_attribs(tagwriter, ("flags", "base_point"))
+        write_tag2(3, name)
+        dxf.export_dxf_attribs(tagwriter, ("xref_path", "description"))
 
     @property
     def is_layout_block(self) -> bool:
@@ -232,11 +232,19 @@ class EndBlk(DXFEntity):
     def export_entity(self, tagwriter: AbstractTagWriter) -> None:
         """Export entity specific data as DXF tags."""
         super().export_entity(tagwriter)
-
-        if tagwriter.dxfversion > DXF12:
-            tagwriter.write_tag2(SUBCLASS_MARKER, acdb_entity.name)
-        if self.dxf.hasattr("paperspace"):
-            tagwriter.write_tag2(67, 1)
-        self.dxf.export_dxf_attribs(tagwriter, "layer")
-        if tagwriter.dxfversion > DXF12:
+        # check DXF version only once
+        r12 = tagwriter.dxfversion == DXF12
+        _export_acdb_entity(self.dxf, tagwriter, r12)
+        if not r12:
             tagwriter.write_tag2(SUBCLASS_MARKER, acdb_block_end.name)
+
+
+def _export_acdb_entity(
+    dxf: DXFNamespace, tagwriter: AbstractTagWriter, r12: bool
+) -> None:
+    """Export the AcDbEntity subclass of BLOCK and ENDBLK."""
+    if not r12:
+        tagwriter.write_tag2(SUBCLASS_MARKER, acdb_entity.name)
+    if dxf.hasattr("paperspace"):
+        tagwriter.write_tag2(67, 1)
+    dxf.export_dxf_attribs(tagwriter, "layer")
@@ -1,11 +1,14 @@
 # Copyright (C) 2018-2023, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import TextIO, TYPE_CHECKING, Union, Sequence, Optional
+from typing import TextIO, TYPE_CHECKING, Union, Sequence, Optional, BinaryIO, Iterator
 import base64
+import contextlib
 import io
+import mmap
 import pathlib
 import os
+import stat
 
 from ezdxf.tools.standards import setup_drawing
 from ezdxf.lldxf.const import DXF2013
@@ -136,12 +139,11 @@ def readfile(
 
     filename = str(filename)
     if is_binary_dxf_file(filename):
-        with open(filename, "rb") as fp:
-            data = fp.read()
+        with open(filename, "rb") as bin_fp, _map_binary_file(bin_fp) as data:
             loader = binary_tags_loader(data, errors=errors)
             doc = Drawing.load(loader)
-            doc.filename = filename
-            return doc
+        doc.filename = filename
+        return doc
 
     if not is_dxf_file(filename):
         raise IOError(f"File '{filename}' is not a DXF file.")
@@ -162,6 +164,27 @@ def readfile(
     return doc
 
 
+@contextlib.contextmanager
+def _map_binary_file(fp: BinaryIO) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Yields the content of the binary file `fp` as read-only memory-mapped file,
+    which avoids copying the whole file into memory. Yields the content as bytes
+    if the file can not be mapped, e.g. pipes or other non-regular files.
+    """
+    try:
+        fileno = fp.fileno()
+        if stat.S_ISREG(os.fstat(fileno).st_mode):
+            data = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        else:
+            data = None
+    except (OSError, ValueError, io.UnsupportedOperation):
+        data = None  # e.g. empty file
+    if data is None:
+        yield fp.read()
+    else:
+        with data:
+            yield data
+
+
 def dxf_file_info(filename: str | os.PathLike) -> DXFInfo:
     """Reads basic file information from a DXF document: DXF version, encoding
     and handle seed.
@@ -1,8 +1,10 @@
 # Copyright (c) 2016-2022, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import Iterable, TextIO, Iterator, Any, Optional, Sequence
+from typing import Iterable, TextIO, Iterator, Any, Optional, Sequence, Union
+import mmap
 import struct
+from binascii import unhexlify
 from .types import (
     DXFTag,
     DXFVertex,
@@ -39,11 +41,15 @@ def internal_tag_compiler(s: str) -> Iterable[DXFTag]:
     pos: int = 0
     count: int = len(lines)
     point: tuple[float, ...]
+    # local names for the lookups done for each tag:
+    point_codes = POINT_CODES
+    binary_data = BINARY_DATA
+    get_type = TYPE_TABLE.get
     while pos < count:
         code = int(lines[pos])
         value = lines[pos + 1]
         pos += 2
-        if code in POINT_CODES:
+        if code in point_codes:
             # next tag; y-axis is mandatory - internal_tag_compiler relies on
             # well formed DXF strings:
             y = lines[pos + 1]
@@ -60,10 +66,10 @@ def internal_tag_compiler(s: str) -> Iterable[DXFTag]:
             else:  # 2d point
                 point = (float(value), float(y))
             yield DXFVertex(code, point)  # 2d/3d point
-        elif code in BINARY_DATA:
-            yield DXFBinaryTag.from_string(code, value)
+        elif code in binary_data:
+            yield DXFBinaryTag(code, unhexlify(value))
         else:  # single value tag: int, float or string
-            yield DXFTag(code, TYPE_TABLE.get(code, str)(value))
+            yield DXFTag(code, get_type(code, str)(value))
 
 
 # No performance advantage by processing binary data!
@@ -132,7 +138,7 @@ def ascii_tags_loader(stream: TextIO, skip_comments: bool = True) -> Iterator[DX
 
 
 def binary_tags_loader(
-    data: bytes, errors: str = "surrogateescape"
+    data: Union[bytes, mmap.mmap], errors: str = "surrogateescape"
 ) -> Iterator[DXFTag]:
     """Yields :class:`DXFTag` or :class:`DXFBinaryTag` objects from binary DXF
     `data` (untrusted external source) and does not optimize coordinates.
@@ -140,7 +146,7 @@ def binary_tags_loader(
     unicode string,``float``, ``int`` or ``bytes`` for binary chunks.
 
     Args:
-        data: binary DXF data
+        data: binary DXF data as bytes or memory-mapped file
         errors: specify decoding error handler
 
             - "surrogateescape" to preserve possible binary data (default)
@@ -159,13 +165,12 @@ def binary_tags_loader(
     def scan_params():
         dxfversion = "AC1009"
         encoding = "cp1252"
-        try:
-            # Limit search to first 1024 bytes - an arbitrary number
+        # mmap objects do not support the index() method, use find() instead
+        # Limit search to first 1024 bytes - an arbitrary number
+        start = data.find(b"$ACADVER", 22, 1024)
+        if start >= 0:  # HEADER var $ACADVER is present
             # start index for 1-byte group code
-            start = data.index(b"$ACADVER", 22, 1024) + 10
-        except ValueError:
-            pass  # HEADER var $ACADVER not present
-        else:
+            start += 10
             if data[start] != 65:  # not 'A' = 2-byte group code
                 start += 1
             dxfversion = data[start : start + 6].decode()
@@ -173,13 +178,11 @@ def binary_tags_loader(
         if dxfversion >= "AC1021":
             encoding = "utf8"
         else:
-            try:
-                # Limit search to first 1024 bytes - an arbitrary number
-                # start index for 1-byte group code
-                start = data.index(b"$DWGCODEPAGE", 22, 1024) + 14
-            except ValueError:
-                pass  # HEADER var $DWGCODEPAGE not present
-            else:  # name schema is 'ANSI_xxxx'
+            # Limit search to first 1024 bytes - an arbitrary number
+            start = data.find(b"$DWGCODEPAGE", 22, 1024)
+            if start >= 0:  # HEADER var $DWGCODEPAGE is present
+                # start index for 1-byte group code, name schema is 'ANSI_xxxx'
+                start += 14
                 if data[start] != 65:  # not 'A' = 2-byte group code
                     start += 1
                 end = start + 5
@@ -235,7 +238,9 @@ def binary_tags_loader(
                 index += 1
             else:  # zero terminated string
                 start_index = index
-                end_index = data.index(b"\x00", start_index)
+                end_index = data.find(b"\x00", start_index)
+                if end_index < 0:
+                    raise DXFStructureError("Unterminated string in binary DXF data.")
                 s = data[start_index:end_index]
                 index = end_index + 1
                 value = s.decode(encoding, errors=errors)
@@ -632,19 +632,13 @@ class Matrix44:
         # This implementation exist only for compatibility to the Cython implementation!
         # This version is 3.4x faster than the Cython version of Matrix44.fast_2d_transform()
         # for larger point arrays but 10.5x slower than the Cython version of this method.
-        if ndim == 2:
-            m = np.array(self.get_2d_transformation(), dtype=np.float64)
-            m.shape = (3, 3)
-        elif ndim == 3:
-            m = np.array(self._matrix, dtype=np.float64)
-            m.shape = (4, 4)
-        else:
+        if ndim != 2 and ndim != 3:
             raise ValueError("ndim has to be 2 or 3")
-
-        v = np.matmul(
-            np.concatenate((array[:, :ndim], np.ones((array.shape[0], 1))), axis=1), m
-        )
-        array[:, :ndim] = v[:, :ndim].copy()
+        m = self._matrix.reshape(4, 4)
+        # affine transformation: a single matrix multiplication of the rotation part
+        # plus the translation row, without building homogeneous coordinates
+        v = array[:, :ndim]
+        array[:, :ndim] = np.matmul(v, m[:ndim, :ndim]) + m[3, :ndim]
 
     def transform_directions(
         self, vectors: Iterable[UVec], normalize=False
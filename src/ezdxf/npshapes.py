@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Iterable, Optional, Iterator, Sequence
 from typing_extensions import Self, TypeAlias
 import abc
+import itertools
 
 import numpy as np
 import numpy.typing as npt
@@ -68,6 +69,18 @@ EMPTY_SHAPE = np.array([], dtype=VertexNumpyType)
 NO_COMMANDS = np.array([], dtype=CommandNumpyType)
 
 
+def _command_table() -> np.ndarray:
+    table = np.full(max(Command) + 1, None, dtype=object)
+    for cmd in Command:
+        table[int(cmd)] = cmd
+    return table
+
+
+# Calling Command(int) for each command code is very slow, map all command codes of a
+# path to Command enums by a single lookup:  COMMAND_TABLE[commands]
+COMMAND_TABLE = _command_table()
+
+
 class NumpyShape2d(abc.ABC):
     """This is an optimization to store many 2D paths and polylines in a compact way
     without sacrificing basic functions like transformation and bounding box calculation.
@@ -101,7 +114,8 @@ class NumpyShape2d(abc.ABC):
         """Returns the shape vertices as list of :class:`Vec2` 
         e.g. [Vec2(1, 2), Vec2(3, 4), ...] 
         """
-        return [Vec2(v) for v in self._vertices]
+        # Vec2(x, y) from Python floats is much faster than Vec2(ndarray-row)
+        return [Vec2(x, y) for x, y in self._vertices.tolist()]
 
     def to_tuples(self) -> list[tuple[float, float]]:
         """Returns the shape vertices as list of 2-tuples 
@@ -165,14 +179,22 @@ class NumpyPath2d(NumpyShape2d):
             self._vertices = EMPTY_SHAPE
             self._commands = NO_COMMANDS
             return
-        # (v.x, v.y) is 4x faster than Vec2(v), see profiling/numpy_array_setup.py
-        vertices = [(v.x, v.y) for v in path.control_vertices()]
-        if len(vertices) == 0:
+        control_vertices = path.control_vertices()
+        count = len(control_vertices)
+        if count:
+            # fill the array by np.fromiter() without building intermediate
+            # (x, y) tuples, see profiling/numpy_array_setup.py
+            self._vertices = np.fromiter(
+                itertools.chain.from_iterable((v.x, v.y) for v in control_vertices),
+                dtype=VertexNumpyType,
+                count=count * 2,
+            ).reshape(count, 2)
+        else:
             try:  # control_vertices() does not return the start point of empty paths
                 vertices = [Vec2(path.start)]
             except IndexError:
                 vertices = []
-        self._vertices = np.array(vertices, dtype=VertexNumpyType)
+            self._vertices = np.array(vertices, dtype=VertexNumpyType)
         self._commands = np.array(path.command_codes(), dtype=CommandNumpyType)
 
     def __len__(self) -> int:
@@ -189,7 +211,7 @@ class NumpyPath2d(NumpyShape2d):
         return Vec2(self._vertices[-1])
 
     def control_vertices(self) -> list[Vec2]:
-        return [Vec2(v) for v in self._vertices]
+        return self.vertices()
 
     def clone(self) -> Self:
         clone = self.__class__(None)
@@ -201,7 +223,7 @@ class NumpyPath2d(NumpyShape2d):
 
     def command_codes(self) -> list[int]:
         """Internal API."""
-        return list(self._commands)
+        return self._commands.tolist()
 
     def commands(self) -> Iterator[PathElement]:
         vertices = self.vertices()
@@ -224,8 +246,8 @@ class NumpyPath2d(NumpyShape2d):
 
     def to_path(self) -> Path:
         """Returns a new :class:`ezdxf.path.Path` instance."""
-        vertices = [Vec3(v) for v in self._vertices]
-        commands = [Command(c) for c in self._commands]
+        vertices = [Vec3(x, y) for x, y in self._vertices.tolist()]
+        commands = COMMAND_TABLE[self._commands].tolist()
         return Path.from_vertices_and_commands(vertices, commands)
 
     @classmethod
@@ -592,7 +614,7 @@ class NumpyShape3d(abc.ABC):
 
     def vertices(self) -> list[Vec3]:
         """Returns the shape vertices as list of :class:`Vec3`."""
-        return [Vec3(v) for v in self._vertices]
+        return [Vec3(x, y, z) for x, y, z in self._vertices.tolist()]
 
     def bbox(self) -> BoundingBox:
         """Returns the bounding box of all vertices."""
@@ -2,7 +2,6 @@
 # License: MIT License
 from __future__ import annotations
 from typing import Iterable, Any, Sequence, Union, overload, Optional
-from array import array
 import struct
 from binascii import unhexlify, hexlify
 from codecs import decode
@@ -12,10 +11,8 @@ Bytes = Union[bytes, bytearray, memoryview]
 
 def hex_strings_to_bytes(data: Iterable[str]) -> bytes:
     """Returns multiple hex strings `data` as bytes."""
-    byte_array = array("B")
-    for hexstr in data:
-        byte_array.extend(unhexlify(hexstr))
-    return byte_array.tobytes()
+    # extending an array("B") by bytes is a slow Python-level loop per byte
+    return b"".join(map(unhexlify, data))
 
 
 def bytes_to_hexstr(data: bytes) -> str:
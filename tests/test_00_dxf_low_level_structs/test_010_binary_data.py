@@ -17,5 +17,9 @@ def test_hexstr_data_to_bytes_2():
     assert hex_strings_to_bytes(["F0F0", "1A1C"]) == b"\xF0\xF0\x1A\x1C"
 
 
+def test_empty_hexstr_data_to_bytes():
+    assert hex_strings_to_bytes([]) == b""
+
+
 def test_bytes_to_hexstr():
     assert bytes_to_hexstr(b"\xff\xff") == "FFFF"
@@ -86,6 +86,13 @@ def test_int_no_eof():
     assert (0, "ENDSEC") == tags[-1]
 
 
+def test_int_binary_data():
+    tags = list(internal_tag_compiler("160\n4\n310\nFF00\n310\n0A0B\n"))
+    assert tags[0] == (160, 4)
+    assert tags[1] == (310, b"\xff\x00")
+    assert tags[2] == (310, b"\x0a\x0b")
+
+
 def external_tag_compiler(text):
     return tag_compiler(ascii_tags_loader(StringIO(text)))
 
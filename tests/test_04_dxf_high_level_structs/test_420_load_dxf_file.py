@@ -27,3 +27,17 @@ def test_load_dxf(dxf):
     psp = doc.layout()
     assert len(psp) == 1
     assert psp[0].dxftype() == "CIRCLE"
+
+
+@pytest.mark.parametrize("dxfversion", ["R12", "R2000"])
+def test_load_binary_dxf(dxfversion, tmp_path):
+    doc = ezdxf.new(dxfversion)
+    doc.modelspace().add_line((0, 0), (1, 0))
+    filename = tmp_path / "binary.dxf"
+    doc.saveas(filename, fmt="bin")
+
+    doc = ezdxf.readfile(filename)  # loaded from a memory-mapped file
+    assert doc.filename == str(filename)
+    msp = doc.modelspace()
+    assert len(msp) == 1
+    assert msp[0].dxftype() == "LINE"
@@ -89,6 +89,16 @@ class TestNumpyPath2d:
         assert clone_.control_vertices() == path.control_vertices()
         assert clone_.command_codes() == path.command_codes()
 
+    def test_command_codes_are_python_ints(self, path):
+        np_path = NumpyPath2d(path)
+        codes = np_path.command_codes()
+        assert codes == path.command_codes()
+        assert all(type(code) is int for code in codes)
+
+    def test_control_vertices(self, path):
+        np_path = NumpyPath2d(path)
+        assert np_path.control_vertices() == Vec2.list(path.control_vertices())
+
     def test_start_point(self, path):
         assert path.start.isclose((1, 2))
 
@@ -402,3 +402,10 @@ class TestTransformArrayInplace:
         control = list(m.transform_vertices(points))
         m.transform_array_inplace(array, ndim=3)
         assert close_vectors(control, array) is True
+
+    def test_preserve_additional_columns(self, m44):
+        # e.g. polyline array: (x, y, start_width, end_width, bulge)
+        array = np.array([(1.0, 2.0, 3.0, 4.0, 5.0)], dtype=np.float64)
+        m = m44.translate(10, 20, 30)
+        m.transform_array_inplace(array, ndim=2)
+        assert array.tolist() == [[11.0, 22.0, 3.0, 4.0, 5.0]]
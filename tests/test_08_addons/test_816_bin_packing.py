@@ -293,6 +293,37 @@ def test_cannot_copy_packer_with_non_empty_bins(packer):
         packer.copy()
 
 
+def test_restore_snapshot(packer):
+    packer.add_bin(*LARGE_BOX)
+    snapshot = packer.snapshot()
+    packer.pack(pick=bp.PickStrategy.BIGGER_FIRST)
+    ratio = packer.get_fill_ratio()
+    packer.restore(snapshot)
+    assert packer.is_packed is False
+    assert packer.bins[0].is_empty is True
+    assert len(packer.items) == 9
+    assert all(item.position == bp.START_POSITION for item in packer.items)
+    packer.pack(pick=bp.PickStrategy.BIGGER_FIRST)
+    assert packer.get_fill_ratio() == pytest.approx(ratio)
+
+
+def test_cannot_snapshot_packed_packer(packer):
+    packer.pack(pick=bp.PickStrategy.BIGGER_FIRST)
+    with pytest.raises(TypeError):
+        packer.snapshot()
+
+
+def test_subset_evaluator_does_not_change_source_packer(packer):
+    packer.add_bin(*LARGE_BOX)
+    evaluator = bp.SubSetEvaluator(packer)
+    picks = [1, 0, 1, 1]
+    assert evaluator.evaluate(picks) == pytest.approx(evaluator.evaluate(picks))
+    assert packer.is_packed is False
+    assert evaluator.evaluate(picks) == pytest.approx(
+        evaluator.run_packer(picks).get_fill_ratio()
+    )
+
+
 def test_cannot_append_bins_to_packed_packer(packer):
     packer.pack(pick=bp.PickStrategy.BIGGER_FIRST)
     with pytest.raises(TypeError):
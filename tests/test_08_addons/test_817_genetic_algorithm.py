@@ -3,6 +3,7 @@
 import random
 
 import pytest
+import numpy as np
 from ezdxf.addons import genetic_algorithm as ga
 from ezdxf.addons import binpacking as bp
 
@@ -12,7 +13,7 @@ class TestFloatDNAZeroOne:
         dna = ga.FloatDNA([1.0] * 20)
         assert all(v == 1.0 for v in dna) is True
 
-    @pytest.mark.parametrize("value", [-0.1, 1.1])
+    @pytest.mark.parametrize("value", [-0.1, 1.1, float("nan")])
     def test_init_value_is_valid(self, value):
         with pytest.raises(ValueError):
             ga.FloatDNA([value] * 20)
@@ -23,6 +24,20 @@ class TestFloatDNAZeroOne:
             dna.flip_mutate_at(index)
         assert list(dna) == pytest.approx([1.0, 0.9, 0.8, 0.7, 0.6])
 
+    def test_flip_mutate_all_locations(self):
+        dna = ga.FloatDNA([0, 0.1, 0.2, 0.3, 0.4])
+        dna.fitness = 1.0
+        ga.FlipMutate().mutate(dna, 1.0)
+        assert list(dna) == pytest.approx([1.0, 0.9, 0.8, 0.7, 0.6])
+        assert dna.fitness is None, "mutated DNA requires a new evaluation"
+
+    def test_flip_mutate_nothing(self):
+        dna = ga.FloatDNA([0, 0.1, 0.2, 0.3, 0.4])
+        dna.fitness = 1.0
+        ga.FlipMutate().mutate(dna, 0.0)
+        assert list(dna) == pytest.approx([0, 0.1, 0.2, 0.3, 0.4])
+        assert dna.fitness == 1.0
+
     def test_iter(self):
         dna = ga.FloatDNA([1.0] * 20)
         assert len(list(dna)) == 20
@@ -50,6 +65,28 @@ class TestFloatDNAZeroOne:
         assert len(dna) == 20
         assert len(set(dna)) > 10
 
+    def test_random_dna_is_seeded_by_random_module(self):
+        random.seed(44)
+        dna1 = ga.FloatDNA.random(20)
+        dna1.flip_mutate(0.5)
+        random.seed(44)
+        dna2 = ga.FloatDNA.random(20)
+        dna2.flip_mutate(0.5)
+        assert dna1 == dna2
+
+    def test_n_random_dna(self):
+        strands = ga.FloatDNA.n_random(5, 20)
+        assert len(strands) == 5
+        assert all(len(dna) == 20 and dna.is_valid for dna in strands)
+        strands[0].flip_mutate(1.0)
+        strands[1][0] = 0.5
+        assert strands[0] != strands[1]
+
+    def test_n_random_dna_do_not_share_memory(self):
+        dna1, dna2 = ga.FloatDNA.n_random(2, 20)
+        assert dna1._data.base is None
+        assert not np.shares_memory(dna1._data, dna2._data)
+
     def test_subscription_setter(self):
         dna = ga.FloatDNA([0.0] * 20)
         dna[-3:] = [0.1, 0.2, 0.3]
@@ -57,6 +94,40 @@ class TestFloatDNAZeroOne:
         assert dna[-3:] == pytest.approx([0.1, 0.2, 0.3])
         assert sum(dna) == pytest.approx(0.6)
 
+    def test_slices_are_independent_copies(self):
+        dna = ga.FloatDNA([0.0] * 5)
+        part = dna[1:3]
+        dna[1:3] = [0.5, 0.5]
+        assert list(part) == [0.0, 0.0]
+
+    def test_two_point_crossover(self):
+        dna1 = ga.FloatDNA([0.0] * 5)
+        dna2 = ga.FloatDNA([1.0] * 5)
+        ga.recombine_dna_2pcx(dna1, dna2, 1, 3)
+        assert list(dna1) == [0.0, 1.0, 1.0, 0.0, 0.0]
+        assert list(dna2) == [1.0, 0.0, 0.0, 1.0, 1.0]
+
+    def test_uniform_crossover(self):
+        dna1 = ga.FloatDNA([0.0] * 50)
+        dna2 = ga.FloatDNA([1.0] * 50)
+        ga.MateUniformCX().recombine(dna1, dna2)
+        assert all(a + b == 1.0 for a, b in zip(dna1, dna2))
+        assert 0.0 < sum(dna1) < 50.0
+
+    def test_reverse_mutate(self):
+        dna = ga.FloatDNA([0.0, 0.1, 0.2, 0.3])
+        ga.ReverseMutate(3).mutate(dna, 1.0)
+        assert list(dna) == [0.2, 0.1, 0.0, 0.3]
+
+    def test_copy(self):
+        dna = ga.FloatDNA([0.0, 0.5, 1.0])
+        dna.fitness = 0.5
+        copy = dna.copy()
+        assert copy == dna
+        assert copy.fitness == 0.5
+        copy.flip_mutate_at(0)
+        assert dna[0] == 0.0
+
 
 class TestBitDNA:
     def test_init_value(self):
@@ -74,12 +145,89 @@ class TestBitDNA:
         assert len(dna) == 20
         assert len(set(dna)) == 2
 
+    def test_n_random_dna(self):
+        strands = ga.BitDNA.n_random(5, 70)
+        assert len(strands) == 5
+        assert all(len(dna) == 70 for dna in strands)
+        assert len(list(strands[0])) == 70
+        copy = strands[1].copy()
+        strands[0].flip_mutate(1.0)
+        assert strands[1] == copy
+
+    def test_n_random_dna_do_not_share_memory(self):
+        dna1, dna2 = ga.BitDNA.n_random(2, 70)
+        assert not np.shares_memory(dna1._data, dna2._data)
+
     def test_subscription_setter(self):
         dna = ga.BitDNA([1] * 20)
         dna[-3:] = [False, False, False]
         assert len(dna) == 20
         assert dna[-4:] == [True, False, False, False]
 
+    def test_bits_beyond_first_bitmap_word(self):
+        values = [bool(i % 3) for i in range(150)]
+        dna = ga.BitDNA(values)
+        assert len(dna) == 150
+        assert list(dna) == values
+        assert dna[-1] is values[-1]
+        dna[100] = True
+        dna[101] = False
+        assert dna[99:102] == [False, True, False]
+
+    def test_index_out_of_range(self):
+        dna = ga.BitDNA([1] * 20)
+        with pytest.raises(IndexError):
+            _ = dna[20]
+
+    def test_flip_mutate_at(self):
+        dna = ga.BitDNA([0] * 70)
+        dna.flip_mutate_at(65)
+        dna.flip_mutate_at(-1)
+        assert [i for i, v in enumerate(dna) if v] == [65, 69]
+
+    def test_flip_mutate_all_bits(self):
+        dna = ga.BitDNA([0, 1] * 50)
+        dna.fitness = 1.0
+        ga.FlipMutate().mutate(dna, 1.0)
+        assert list(dna) == [True, False] * 50
+        assert dna.fitness is None
+
+    def test_random_dna_is_seeded_by_random_module(self):
+        random.seed(44)
+        dna1 = ga.BitDNA.random(100)
+        dna1.flip_mutate(0.5)
+        random.seed(44)
+        dna2 = ga.BitDNA.random(100)
+        dna2.flip_mutate(0.5)
+        assert dna1 == dna2
+
+    def test_two_point_crossover_beyond_first_bitmap_word(self):
+        dna1 = ga.BitDNA([0] * 150)
+        dna2 = ga.BitDNA([1] * 150)
+        ga.recombine_dna_2pcx(dna1, dna2, 60, 130)
+        assert list(dna1) == [False] * 60 + [True] * 70 + [False] * 20
+        assert list(dna2) == [True] * 60 + [False] * 70 + [True] * 20
+
+    def test_uniform_crossover(self):
+        dna1 = ga.BitDNA([0] * 150)
+        dna2 = ga.BitDNA([1] * 150)
+        ga.MateUniformCX().recombine(dna1, dna2)
+        assert len(dna1) == 150
+        assert all(a is not b for a, b in zip(dna1, dna2))
+        assert 0 < sum(dna1) < 150
+
+    def test_equality_and_copy(self):
+        dna = ga.BitDNA([0, 1] * 50)
+        copy = dna.copy()
+        assert copy == dna
+        copy.flip_mutate_at(0)
+        assert copy != dna
+        assert ga.BitDNA([0] * 10) != ga.BitDNA([0] * 11)
+
+    def test_str(self):
+        dna = ga.BitDNA([0, 1, 1])
+        assert str(dna) == "[0, 1, 1], fitness=None"
+
 
 class TestUniqueIntDNA:
     def test_init_value(self):
@@ -163,6 +311,14 @@ class TestIntegerDNA:
             dna.flip_mutate_at(index)
         assert list(dna) == [4, 3, 2, 1, 0]
 
+    def test_copy(self):
+        dna = ga.IntegerDNA([0, 1, 2, 3, 4], 5)
+        copy = dna.copy()
+        assert copy == dna
+        copy.flip_mutate_at(0)
+        assert list(copy) == [4, 1, 2, 3, 4]
+        assert list(dna) == [0, 1, 2, 3, 4]
+
     def test_reset_data(self):
         dna = ga.IntegerDNA([0, 1, 2, 3, 4, 0, 1, 2, 3, 4], 5)
         dna.reset([4, 3, 2, 1, 0, 1, 2, 3, 2, 1])
@@ -177,6 +333,21 @@ class TestIntegerDNA:
         assert dna.is_valid is True
 
 
+@pytest.mark.parametrize(
+    "dna",
+    [
+        ga.FloatDNA([0.5, 0.5]),
+        ga.BitDNA([True, False]),
+        ga.UniqueIntDNA(3),
+        ga.IntegerDNA([0, 1], 2),
+    ],
+    ids=["float", "bit", "unique_int", "integer"],
+)
+def test_dna_has_no_instance_dict(dna):
+    assert not hasattr(dna, "__dict__")
+    assert not hasattr(dna.copy(), "__dict__")
+
+
 class TestHallOfFame:
     @pytest.fixture
     def candidates(self):
@@ -235,6 +406,20 @@ def test_scramble_mutate():
     assert len(set(dna)) == 10
 
 
+def test_neighbor_swap_mutate():
+    dna = ga.UniqueIntDNA(4)
+    mutate = ga.NeighborSwapMutate()
+    mutate.mutate(dna, 1.0)
+    assert list(dna) == [1, 2, 0, 3]
+
+
+def test_random_swap_mutate():
+    dna = ga.UniqueIntDNA(10)
+    mutate = ga.RandomSwapMutate()
+    mutate.mutate(dna, 1.0)
+    assert len(set(dna)) == 10
+
+
 def test_tournament_selection():
     candidates = [ga.UniqueIntDNA(10) for _ in range(10)]
     for index, dna in enumerate(candidates):
@@ -273,6 +458,54 @@ class TestRouletteSelection:
                 count += 1
         assert count > 1
 
+    def test_pick_count(self):
+        candidates = ga.BitDNA.n_random(5, 10)
+        for fitness, dna in enumerate(candidates, start=1):
+            dna.fitness = fitness
+        selector = self.SELECTOR()
+        selector.reset(candidates)
+        assert len(list(selector.pick(17))) == 17
+
+    def test_ignores_candidates_with_zero_weight(self):
+        dna1, dna2 = ga.BitDNA.n_random(2, 10)
+        dna1.fitness = 0.0
+        dna2.fitness = 1.0
+        selector = ga.RouletteSelection()
+        selector.reset([dna1, dna2])
+        assert all(dna is dna2 for dna in selector.pick(20))
+
+    def test_all_weights_zero(self):
+        candidates = ga.BitDNA.n_random(3, 10)
+        for dna in candidates:
+            dna.fitness = 0.0
+        selector = ga.RouletteSelection()
+        selector.reset(candidates)
+        assert all(dna in candidates for dna in selector.pick(10))
+
+    def test_negative_weights_raise_value_error(self):
+        dna1, dna2 = ga.BitDNA.n_random(2, 10)
+        dna1.fitness = -1.0
+        dna2.fitness = 2.0
+        selector = ga.RouletteSelection()
+        with pytest.raises(ValueError):
+            selector.reset([dna1, dna2])
+
+    def test_pick_is_seeded_by_random_module(self):
+        candidates = ga.BitDNA.n_random(5, 10)
+        for fitness, dna in enumerate(candidates, start=1):
+            dna.fitness = fitness
+        selector = self.SELECTOR()
+        selector.reset(candidates)
+        random.seed(44)
+        picks = list(selector.pick(20))
+        random.seed(44)
+        assert list(selector.pick(20)) == picks
+
+
+def test_conv_negative_weights():
+    weights = ga.conv_negative_weights([-100.0, -10.0, 0.0])
+    assert list(weights) == pytest.approx([0.01, 0.1, 0.0])
+
 
 class TestRankBasedSelection(TestRouletteSelection):
     SELECTOR = ga.RankBasedSelection
@@ -361,6 +594,15 @@ class DummyEvaluator(ga.Evaluator):
         return packer
 
 
+class CountingEvaluator(ga.Evaluator):
+    def __init__(self):
+        self.evaluated: list[ga.DNA] = []
+
+    def evaluate(self, dna: ga.DNA) -> float:
+        self.evaluated.append(dna)
+        return sum(dna)
+
+
 class TestGeneticOptimizer:
     def test_init(self, packer):
         driver = ga.GeneticOptimizer(packer, 100)
@@ -378,6 +620,79 @@ class TestGeneticOptimizer:
         with pytest.raises(TypeError):
             optimizer.execute()
 
+    def test_next_generation_preserves_population_size(self, packer):
+        optimizer = ga.GeneticOptimizer(DummyEvaluator(packer), 10)
+        optimizer.elitism = 0
+        optimizer.add_candidates(ga.BitDNA.n_random(20, 10))
+        optimizer.measure_fitness()
+        optimizer.next_generation()
+        assert optimizer.count == 20
+
+    def test_next_generation_without_crossover_and_mutation(self, packer):
+        optimizer = ga.GeneticOptimizer(DummyEvaluator(packer), 10)
+        optimizer.crossover_rate = 0.0
+        optimizer.mutation_rate = 0.0
+        parents = ga.FloatDNA.n_random(10, 20)
+        optimizer.add_candidates(parents)
+        optimizer.measure_fitness()
+        optimizer.next_generation()
+        assert all(dna in parents for dna in optimizer.candidates)
+
+    def test_next_generation_calls_recombine(self, packer):
+        class Optimizer(ga.GeneticOptimizer):
+            pairs = 0
+
+            def recombine(self, dna1, dna2):
+                self.pairs += 1
+
+        optimizer = Optimizer(DummyEvaluator(packer), 10)
+        optimizer.elitism = 0
+        optimizer.add_candidates(ga.BitDNA.n_random(20, 10))
+        optimizer.measure_fitness()
+        optimizer.next_generation()
+        assert optimizer.pairs == 10
+
+    @pytest.mark.parametrize(
+        "dna_type, mate",
+        [
+            (ga.BitDNA, ga.Mate2pCX()),
+            (ga.FloatDNA, ga.MateUniformCX()),
+            (ga.UniqueIntDNA, ga.MateOrderedCX()),
+        ],
+    )
+    def test_run_is_seeded_by_random_module(self, dna_type, mate):
+        def run():
+            random.seed(44)
+            optimizer = ga.GeneticOptimizer(CountingEvaluator(), 20)
+            optimizer.selection = ga.RankBasedSelection()
+            optimizer.mate = mate
+            optimizer.mutation_rate = 0.1
+            optimizer.add_candidates(dna_type.n_random(20, 10))
+            optimizer.execute()
+            return optimizer.best_dna
+
+        assert run() == run()
+
+    def test_elites_are_not_evaluated_again(self, packer):
+        random.seed(44)
+        evaluator = CountingEvaluator()
+        optimizer = ga.GeneticOptimizer(evaluator, 10)
+        optimizer.elitism = 2
+        optimizer.add_candidates(ga.FloatDNA.n_random(20, 10))
+        optimizer.measure_fitness()
+        elites = optimizer.hall_of_fame.get(2)
+        fitness = [dna.fitness for dna in elites]
+        evaluator.evaluated.clear()
+
+        optimizer.next_generation()
+        optimizer.measure_fitness()
+        # offspring can be equal to the elites, check identity:
+        assert all(
+            any(c is dna for c in optimizer.candidates) for dna in elites
+        )
+        assert not any(e is dna for dna in elites for e in evaluator.evaluated)
+        assert [dna.fitness for dna in elites] == fitness
+
     def test_execution(self, packer):
         packer.add_bin(*MEDIUM_BOX)
         evaluator = DummyEvaluator(packer)